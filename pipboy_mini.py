@@ -27,7 +27,7 @@
     If the countdown completes, the Pi powers off via `sudo systemctl poweroff`.
 
   DEPENDENCIES:
-    sudo apt-get install python3-pil python3-numpy pygame
+    sudo apt-get install python3-pil pygame
     sudo pip3 install spidev --break-system-packages
     (lgpio or RPi.GPIO — lgpio preferred on Trixie)
 
@@ -46,10 +46,16 @@
 
 import sys
 import os
+import re
 import time
+import atexit
+import queue
+import socket
 import threading
 import subprocess
 import shutil
+import functools
+from collections import deque
 
 # ---------------------------------------------------------------------------
 # GPIO backend selection — tries lgpio first (standard on Debian 13 Trixie),
@@ -86,6 +92,13 @@ import numpy as np
 # Audio — pygame.mixer for MP3 playback.  Install with:
 #   sudo apt-get install python3-pygame
 # ---------------------------------------------------------------------------
+
+# Mixer buffer in samples.  512 (~11.6 ms at 44.1 kHz) caused ALSA
+# "underrun occurred" spam on the Pi Zero whenever the GIL or an SPI blit
+# got in the way; 4096 (~93 ms extra latency) is imperceptible for music
+# playback and keeps ALSA fed.
+AUDIO_BUFFER = 4096
+
 try:
     import pygame
     # On a headless Pi with no ALSA output, mixer.init() will throw.
@@ -93,15 +106,20 @@ try:
     # object exists and we can attempt playback later (e.g. after a USB
     # audio device is plugged in, or via Bluetooth).
     os.environ.setdefault("SDL_AUDIODRIVER", "alsa")
-    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=AUDIO_BUFFER)
     try:
         pygame.mixer.init()
     except pygame.error:
         # Real driver failed — fall back to dummy so mixer exists
         os.environ["SDL_AUDIODRIVER"] = "dummy"
-        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=AUDIO_BUFFER)
         pygame.mixer.init()
         print("WARNING: No audio device found. RADIO playback will not produce sound.")
+    # The SDL event queue carries end-of-track notifications; it needs the
+    # video subsystem initialised, for which the dummy driver is enough on a
+    # headless Pi.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
     AUDIO_AVAILABLE = True
 except Exception as e:
     AUDIO_AVAILABLE = False
@@ -116,6 +134,10 @@ except Exception as e:
 DISP_WIDTH  = 128
 DISP_HEIGHT = 128
 DISP_ROTATE = 0   # 0, 90, 180, 270 — adjust if your physical orientation differs
+# SPI clock.  62.5 MHz is the next valid BCM core-clock divisor above 40 MHz
+# and most ST7735S boards tolerate it fine despite the 15 MHz datasheet
+# nominal.  If you see pixel corruption, drop back to 31_200_000.
+SPI_HZ      = 62_500_000
 
 # SPI pins (fixed by Waveshare HAT hardware wiring)
 PIN_RST = 27
@@ -134,10 +156,10 @@ PIN_KEY1      = 21
 PIN_KEY2      = 20
 PIN_KEY3      = 16
 
-ALL_INPUT_PINS = [
+ALL_INPUT_PINS = (
     PIN_JOY_UP, PIN_JOY_DOWN, PIN_JOY_LEFT, PIN_JOY_RIGHT, PIN_JOY_PRESS,
-    PIN_KEY1, PIN_KEY2, PIN_KEY3
-]
+    PIN_KEY1, PIN_KEY2, PIN_KEY3,
+)
 
 # File paths (relative to script location)
 SCRIPT_DIR    = os.path.dirname(os.path.abspath(__file__))
@@ -155,11 +177,20 @@ CLR_AMBER    = (255, 191, 0)    # amber accent for warnings / highlights
 CLR_WHITE    = (255, 255, 255)
 CLR_GREY     = (100, 100, 100)
 CLR_CYAN     = (0,   200, 200)  # subtle accent for selected items
+CLR_ROW_SHADE = (0,  12,  0)    # alternating-row background (INV)
+CLR_SEL_SHADE = (0,  30,  10)   # selection-bar background (RADIO)
 
 # Timing
 INPUT_DEBOUNCE_MS = 150   # minimum ms between repeated key events
 REFRESH_RATE_HZ   = 10    # screen redraws per second
 
+# Idle power saving — the X306's battery level isn't software-readable, so
+# draw is the one thing we can actually manage.  After this many seconds
+# without a button press the backlight is PWM-dimmed to the given duty;
+# any press restores full brightness.
+IDLE_DIM_SECS = 30
+IDLE_DIM_DUTY = 20        # percent brightness while idle-dimmed
+
 
 # =============================================================================
 # ST7735S DISPLAY DRIVER (minimal — SPI only)
@@ -190,12 +221,32 @@ class ST7735Display:
     def __init__(self):
         self.spi = spidev.SpiDev()
         self.spi.open(0, 0)
-        self.spi.max_speed_hz = 40_000_000
+        self.spi.max_speed_hz = SPI_HZ
         self.spi.mode = 0
 
         self._pin_setup()
+        self._dc_state = None   # last level written to the D/C line
+        self._bl_pwm = None     # RPi.GPIO software-PWM handle (lazy)
         self._init_display()
 
+        # Frame pump: show_image() only converts PIL -> bytes and enqueues;
+        # this worker owns the (slow) SPI transfer, so the main loop can start
+        # rendering frame N+1 while frame N is still shifting out.  maxsize=1
+        # with drop-oldest semantics means a slow blit never stalls rendering
+        # — a stale queued frame is simply replaced by the newer one.
+        self._frame_q = queue.Queue(maxsize=1)
+        self._last_queued = None    # last RGB565 frame enqueued (main thread)
+        self._prev_buf = None       # last RGB565 frame pushed (pump thread only)
+        self._pump = threading.Thread(target=self._pump_loop, daemon=True)
+        self._pump.start()
+
+    def _pump_loop(self):
+        while True:
+            buf = self._frame_q.get()
+            if buf is None:            # sentinel from cleanup()
+                return
+            self._blit(buf)
+
     # --- GPIO helpers (backend-agnostic) -----------------------------------
     def _pin_setup(self):
         if GPIO_BACKEND == "lgpio":
@@ -232,49 +283,133 @@ class ST7735Display:
         time.sleep(0.15)
         self._send_command(self._SLPOUT)
         time.sleep(0.15)
-        self._send_command(self._COLMOD, [0x55])   # 16-bit RGB565
-        self._send_command(self._MADCTL, [self._MADCTL_MX | self._MADCTL_MV | self._MADCTL_BGR])
+        self._send_command(self._COLMOD, (0x55,))   # 16-bit RGB565
+        self._send_command(self._MADCTL, (self._MADCTL_MX | self._MADCTL_MV | self._MADCTL_BGR,))
         self._send_command(self._DISPON)
 
+        # Address window: the column range never changes (full width, with
+        # this panel's +1 column offset), so CASET is programmed exactly once
+        # here.  The row window is tracked in _row_window and reprogrammed by
+        # _blit only when the dirty band actually moves — RAMWR rewinds the
+        # write pointer to the window origin on every frame regardless.
+        self._send_command(self._CASET, (0x00, 0x01, 0x00, DISP_WIDTH))  # col 1..128
+        self._send_command(self._RASET, (0x00, 0x00, 0x00, DISP_HEIGHT - 1))
+        self._row_window = (0, DISP_HEIGHT - 1)
+
         # Backlight on
         self._pin_high(PIN_BL)
 
     # --- Low-level SPI send ------------------------------------------------
+    def _set_dc(self, level: int):
+        """Drive the D/C line, skipping the GPIO write if already at level."""
+        if level != self._dc_state:
+            (self._pin_high if level else self._pin_low)(PIN_DC)
+            self._dc_state = level
+
     def _send_command(self, cmd, data=None):
-        self._pin_low(PIN_DC)          # command mode
-        self.spi.xfer2([cmd])
+        self._set_dc(0)                # command mode
+        self.spi.writebytes(bytes((cmd,)))
         if data:
-            self._pin_high(PIN_DC)     # data mode
-            self.spi.xfer2(data)
+            self._set_dc(1)            # data mode
+            self.spi.writebytes2(bytes(data))
 
     # --- Public: blit a PIL Image to the display ---------------------------
     def show_image(self, img: Image.Image):
-        """Send a 128x128 RGB PIL image to the display."""
-        if img.size != (DISP_WIDTH, DISP_HEIGHT):
-            img = img.resize((DISP_WIDTH, DISP_HEIGHT))
-
-        # Convert to RGB565 byte array
-        rgb = np.array(img.convert("RGB"), dtype=np.uint16)
-        r = (rgb[:, :, 0] >> 3).astype(np.uint16)
-        g = (rgb[:, :, 1] >> 2).astype(np.uint16)
-        b = (rgb[:, :, 2] >> 3).astype(np.uint16)
-        pixel16 = (r << 11) | (g << 5) | b
-        buf = pixel16.astype(">u2").tobytes()   # big-endian 16-bit
-
-        # Set full-screen write window
-        self._send_command(self._CASET, [0x00, 0x01, 0x00, DISP_WIDTH])  # col 1..128
-        self._send_command(self._RASET, [0x00, 0x00, 0x00, DISP_HEIGHT - 1])
+        """Queue a PIL image for transfer to the display.
+
+        Callers must supply a native-size (128x128) RGB image — every frame
+        comes out of new_frame() or a template copy of one, so the old
+        defensive resize was a dead branch on the hot path.
+        """
+        if img.mode != "RGB":
+            # convert() copies even for a same-mode no-op; frames are always
+            # RGB in practice, so this branch is for odd callers only.
+            img = img.convert("RGB")
+        # Pack RGB888 → big-endian RGB565 in one fused expression: a single
+        # uint16 temporary plus a byteswap, instead of the old three-array
+        # shift/OR pipeline with its per-channel astype() copies.
+        arr = np.asarray(img, dtype=np.uint16)
+        pixel16 = (((arr[:, :, 0] & 0xF8) << 8) |
+                   ((arr[:, :, 1] & 0xFC) << 3) |
+                   (arr[:, :, 2] >> 3))
+        buf = pixel16.byteswap().tobytes()   # big-endian 16-bit
+
+        # Identical to what we last queued?  Don't wake the pump at all —
+        # idle screens (STAT between samples, a stopped RADIO list) go from
+        # ten pushes a second to none.
+        if buf == self._last_queued:
+            return
+        self._last_queued = buf
+
+        # Drop-oldest enqueue: never block the render loop on SPI.
+        try:
+            self._frame_q.put_nowait(buf)
+        except queue.Full:
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put_nowait(buf)
+
+    _ROW_BYTES = DISP_WIDTH * 2    # one display row of packed RGB565
+
+    def _blit(self, buf: bytes):
+        """Push a pre-packed RGB565 buffer over SPI (pump thread only).
+
+        Diffs against the previously pushed frame and only transmits the
+        band of rows that actually changed — a moved scroll thumb or an
+        updated value line costs a few rows instead of the full 32 KB.
+        Row compares are bytes slice equality, i.e. memcmp in C.
+        """
+        rb = self._ROW_BYTES
+        prev = self._prev_buf
+        first, last = 0, DISP_HEIGHT - 1
+        if prev is not None:
+            first = next((y for y in range(DISP_HEIGHT)
+                          if buf[y * rb:(y + 1) * rb] != prev[y * rb:(y + 1) * rb]),
+                         None)
+            if first is None:
+                return              # frame identical — nothing to transmit
+            last = next(y for y in range(DISP_HEIGHT - 1, first - 1, -1)
+                        if buf[y * rb:(y + 1) * rb] != prev[y * rb:(y + 1) * rb])
+        self._prev_buf = buf
+
+        # Row window: only reprogram when the changed band differs from what
+        # the panel is already set to (columns were fixed at init).
+        if (first, last) != self._row_window:
+            self._send_command(self._RASET, (0x00, first, 0x00, last))
+            self._row_window = (first, last)
 
         # Blast pixel data
-        self._pin_low(PIN_DC)
-        self.spi.xfer2([self._RAMWR])
-        self._pin_high(PIN_DC)
-        # SPI xfer2 max buffer is typically 4096 bytes on Linux; chunk it
-        chunk = 4096
-        for i in range(0, len(buf), chunk):
-            self.spi.xfer2(list(buf[i:i+chunk]))
+        self._set_dc(0)
+        self.spi.writebytes(bytes((self._RAMWR,)))
+        self._set_dc(1)
+        # writebytes2 takes the bytes object as-is (no bytes->list marshalling)
+        # and auto-chunks in C against the kernel's spidev.bufsiz.  Append
+        # spidev.bufsiz=65536 to /boot/firmware/cmdline.txt to ship the whole
+        # frame in a single ioctl.
+        self.spi.writebytes2(buf[first * rb:(last + 1) * rb])
+
+    def set_backlight_dim(self, dimmed: bool):
+        """PWM the backlight down for idle power saving (or restore it)."""
+        duty = IDLE_DIM_DUTY if dimmed else 100
+        if GPIO_BACKEND == "lgpio":
+            # 100% duty is a solid high, same as the plain backlight-on write.
+            lgpio.tx_pwm(self._chip, PIN_BL, 1000, duty)
+        else:
+            if self._bl_pwm is None:
+                self._bl_pwm = GPIO.PWM(PIN_BL, 1000)
+                self._bl_pwm.start(duty)
+            else:
+                self._bl_pwm.ChangeDutyCycle(duty)
 
     def cleanup(self):
+        # Let the pump drain any queued frame, then stop it before touching
+        # the SPI handle.
+        self._frame_q.put(None)
+        self._pump.join(timeout=2)
+        if self._bl_pwm is not None:
+            self._bl_pwm.stop()
         self._pin_low(PIN_BL)
         self.spi.close()
         if GPIO_BACKEND == "lgpio":
@@ -303,6 +438,12 @@ EVT_SHUTDOWN = "SHUTDOWN"          # not from a single pin — synthesised by ma
 SHUTDOWN_COMBO_PINS = (PIN_KEY1, PIN_KEY2)
 SHUTDOWN_CONFIRM_SECS = 3          # seconds the countdown runs before executing
 
+# Wakes the main loop when there is something worth redrawing for — a button
+# edge or a fresh stat sample.  The run loop waits on this (with a fallback
+# heartbeat) instead of sleeping a fixed 10 Hz schedule, so an idle screen
+# costs ~1 wakeup per second.
+WAKE_EVENT = threading.Event()
+
 PIN_TO_EVT = {
     PIN_JOY_UP:    EVT_UP,
     PIN_JOY_DOWN:  EVT_DOWN,
@@ -317,71 +458,118 @@ PIN_TO_EVT = {
 
 class InputManager:
     """
-    Polls all input pins on every tick.  Generates an event string on the
-    falling edge (button pressed) with software debounce.  Thread-safe —
-    the main loop can call get_event() each frame.
+    Event-driven button reader.  Each pin is claimed with a falling-edge
+    alert (lgpio) or edge detect (RPi.GPIO), so presses are queued by a
+    kernel-fed callback with no per-frame polling.  Thread-safe — the main
+    loop can call get_event() each frame.
     """
 
     def __init__(self):
-        self._lock = threading.Lock()
-        self._event_queue = []
-        self._last_state = {}      # pin -> bool (True = pressed)
-        self._last_time  = {}      # pin -> timestamp of last accepted event
+        # deque.append / popleft are atomic under the GIL, so the queue needs
+        # no lock even though the edge callbacks run on library threads.
+        self._event_queue = deque()
+        self._last_time = {pin: 0 for pin in ALL_INPUT_PINS}  # debounce, per pin
         self._chip = None
+        self._callbacks = []       # keep references or lgpio drops them
+        # Shutdown-combo tracking: the combo pins are watched on both edges
+        # so press/release state is known without polling.  combo_event is
+        # set while both are held; the main loop just checks the flag.
+        self._held = set()
+        self.combo_event = threading.Event()
 
         if GPIO_BACKEND == "lgpio":
             self._chip = lgpio.gpiochip_open(0)
             for pin in ALL_INPUT_PINS:
-                lgpio.gpio_claim_input(self._chip, pin, lgpio.SET_PULL_UP)
+                edge = (lgpio.BOTH_EDGES if pin in SHUTDOWN_COMBO_PINS
+                        else lgpio.FALLING_EDGE)
+                lgpio.gpio_claim_alert(self._chip, pin, edge, lgpio.SET_PULL_UP)
+                self._callbacks.append(
+                    lgpio.callback(self._chip, pin, edge, self._on_edge))
         else:
             GPIO.setmode(GPIO.BCM)
             for pin in ALL_INPUT_PINS:
                 GPIO.setup(pin, GPIO.IN, pull_up_or_down=GPIO.PUD_UP)
+                if pin in SHUTDOWN_COMBO_PINS:
+                    # Both edges, debounced manually — bouncetime= would
+                    # swallow a release that follows the press quickly.
+                    GPIO.add_event_detect(pin, GPIO.BOTH,
+                                          callback=self._on_both_rpigpio)
+                else:
+                    GPIO.add_event_detect(pin, GPIO.FALLING,
+                                          callback=self._on_edge_rpigpio,
+                                          bouncetime=INPUT_DEBOUNCE_MS)
 
-        for pin in ALL_INPUT_PINS:
-            self._last_state[pin] = False
-            self._last_time[pin]  = 0
+    def _on_edge(self, chip, gpio, level, tick):
+        """lgpio alert callback (runs on lgpio's notify thread).
 
-    def _read_pin(self, pin) -> bool:
-        """Return True if the pin is currently pressed (active-low)."""
-        if GPIO_BACKEND == "lgpio":
-            return lgpio.gpio_read(self._chip, pin) == 0
-        else:
-            return GPIO.input(pin) == GPIO.LOW
-
-    def poll(self):
-        """Call once per frame.  Detects new presses and queues events."""
-        now = time.time() * 1000  # ms
-        for pin in ALL_INPUT_PINS:
-            pressed = self._read_pin(pin)
-            was_pressed = self._last_state[pin]
-            if pressed and not was_pressed:
-                # Rising edge (active-low → press detected)
-                if (now - self._last_time[pin]) >= INPUT_DEBOUNCE_MS:
-                    with self._lock:
-                        self._event_queue.append(PIN_TO_EVT[pin])
-                    self._last_time[pin] = now
-            self._last_state[pin] = pressed
+        *tick* is the kernel event timestamp in nanoseconds, so debouncing
+        never touches the system clock.
+        """
+        if level == 1:              # rising = active-low button released
+            self._held.discard(gpio)
+            self.combo_event.clear()
+            return
+        # Combo state must track every falling edge: the debounce below only
+        # suppresses duplicate *events*, and releases are processed above
+        # unconditionally, so a bounce inside the window would otherwise
+        # leave a held button missing from _held.
+        self._note_pressed(gpio)
+        if (tick - self._last_time[gpio]) < INPUT_DEBOUNCE_MS * 1_000_000:
+            return
+        self._last_time[gpio] = tick
+        self._event_queue.append(PIN_TO_EVT[gpio])
+        WAKE_EVENT.set()
+
+    def _on_edge_rpigpio(self, pin):
+        # RPi.GPIO already debounced via bouncetime= above.
+        self._event_queue.append(PIN_TO_EVT[pin])
+        WAKE_EVENT.set()
+
+    def _on_both_rpigpio(self, pin):
+        if GPIO.input(pin) != GPIO.LOW:     # released
+            self._held.discard(pin)
+            self.combo_event.clear()
+            return
+        # As in _on_edge: state first, then the event debounce.
+        self._note_pressed(pin)
+        now = time.monotonic_ns()
+        if now - self._last_time[pin] < INPUT_DEBOUNCE_MS * 1_000_000:
+            return
+        self._last_time[pin] = now
+        self._event_queue.append(PIN_TO_EVT[pin])
+        WAKE_EVENT.set()
+
+    def _note_pressed(self, pin):
+        """Update combo state after a debounced press of *pin*."""
+        if pin in SHUTDOWN_COMBO_PINS:
+            self._held.add(pin)
+            if self._held.issuperset(SHUTDOWN_COMBO_PINS):
+                self.combo_event.set()
+                WAKE_EVENT.set()   # the completing press may be debounced
+
+    def pending(self) -> bool:
+        """True if at least one event is queued."""
+        return bool(self._event_queue)
 
     def get_event(self):
         """Return the next pending event string, or None."""
-        with self._lock:
-            if self._event_queue:
-                return self._event_queue.pop(0)
-        return None
-
-    def pins_held(self, pins) -> bool:
-        """Return True if every pin in *pins* is currently pressed.
+        try:
+            return self._event_queue.popleft()
+        except IndexError:
+            return None
 
-        This is a raw state check (no debounce, no edge detection) — intended
-        for detecting held combos that the single-button event queue can't see.
-        """
-        return all(self._read_pin(p) for p in pins)
+    def drain_events(self):
+        """Throw away everything queued (deque.clear is O(1) and atomic)."""
+        self._event_queue.clear()
 
     def cleanup(self):
         if GPIO_BACKEND == "lgpio" and self._chip is not None:
+            for cb in self._callbacks:
+                cb.cancel()
             lgpio.gpiochip_close(self._chip)
         else:
+            for pin in ALL_INPUT_PINS:
+                GPIO.remove_event_detect(pin)
             GPIO.cleanup(ALL_INPUT_PINS)
 
 
@@ -421,23 +609,39 @@ FONT_BIG    = _load_font("DejaVuSansMono.ttf", 13)   # large labels
 # SHARED DRAWING UTILITIES
 # =============================================================================
 
-def draw_header(draw: ImageDraw.ImageDraw, title: str, screen_index: int, screen_count: int):
-    """Draw the top header bar: left-aligned title + right-aligned screen nav."""
-    # Background bar
-    draw.rectangle([(0, 0), (DISP_WIDTH - 1, 14)], fill=CLR_GREEN_DIM)
+# Header and footer bars are drawn from a tiny fixed set of strings, so the
+# rendered bars are cached whole — pasting a pre-rasterized strip replaces a
+# rectangle fill plus one or two FreeType text runs per frame.
+
+@functools.lru_cache(maxsize=16)
+def _render_header(title: str, screen_index: int, screen_count: int) -> Image.Image:
+    img = Image.new("RGB", (DISP_WIDTH, 15), CLR_GREEN_DIM)
+    d = ImageDraw.Draw(img)
     # Title
-    draw.text((3, 1), title, fill=CLR_GREEN, font=FONT_TITLE)
+    d.text((3, 1), title, fill=CLR_GREEN, font=FONT_TITLE)
     # Screen indicator (e.g. "2/3")
     nav_text = f"{screen_index+1}/{screen_count}"
-    bbox = draw.textbbox((0, 0), nav_text, font=FONT_SMALL)
-    nav_w = bbox[2] - bbox[0]
-    draw.text((DISP_WIDTH - nav_w - 3, 2), nav_text, fill=CLR_GREEN_MID, font=FONT_SMALL)
+    bbox = d.textbbox((0, 0), nav_text, font=FONT_SMALL)
+    d.text((DISP_WIDTH - (bbox[2] - bbox[0]) - 3, 2), nav_text,
+           fill=CLR_GREEN_MID, font=FONT_SMALL)
+    return img
+
+
+@functools.lru_cache(maxsize=16)
+def _render_footer(hints: str) -> Image.Image:
+    img = Image.new("RGB", (DISP_WIDTH, 13), CLR_GREEN_DIM)
+    ImageDraw.Draw(img).text((2, 1), hints, fill=CLR_GREEN_MID, font=FONT_SMALL)
+    return img
+
+
+def draw_header(img: Image.Image, title: str, screen_index: int, screen_count: int):
+    """Paste the top header bar: left-aligned title + right-aligned screen nav."""
+    img.paste(_render_header(title, screen_index, screen_count), (0, 0))
 
 
-def draw_footer(draw: ImageDraw.ImageDraw, hints: str):
-    """Draw a small footer bar with contextual button hints."""
-    draw.rectangle([(0, DISP_HEIGHT - 13), (DISP_WIDTH - 1, DISP_HEIGHT - 1)], fill=CLR_GREEN_DIM)
-    draw.text((2, DISP_HEIGHT - 12), hints, fill=CLR_GREEN_MID, font=FONT_SMALL)
+def draw_footer(img: Image.Image, hints: str):
+    """Paste the small footer bar with contextual button hints."""
+    img.paste(_render_footer(hints), (0, DISP_HEIGHT - 13))
 
 
 def draw_divider(draw: ImageDraw.ImageDraw, y: int):
@@ -445,55 +649,134 @@ def draw_divider(draw: ImageDraw.ImageDraw, y: int):
     draw.line([(0, y), (DISP_WIDTH - 1, y)], fill=CLR_GREEN_DIM, width=1)
 
 
+# Per-glyph bitmap cache.  ImageDraw.text re-rasterizes every glyph through
+# FreeType on each call, which dominates the cost of text-heavy frames.  The
+# UI draws from a small, repetitive character set in a couple of colours, so
+# each (font, char, colour) glyph is rendered once and pasted thereafter.
+_GLYPH_CACHE = {}
+
+
+def blit_text(img: Image.Image, xy, text: str, font, fill):
+    """Draw *text* onto *img* by pasting cached per-glyph bitmaps.
+
+    Matches ImageDraw.text for the monospace fonts this app uses (fixed
+    advance, no kerning); proportional fallback fonts render fine too, just
+    without kerning.
+    """
+    x, y = xy
+    for ch in text:
+        key = (id(font), ch, fill)
+        entry = _GLYPH_CACHE.get(key)
+        if entry is None:
+            bbox = font.getbbox(ch)
+            w, h = max(1, bbox[2]), max(1, bbox[3])
+            glyph = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+            ImageDraw.Draw(glyph).text((0, 0), ch, fill=fill, font=font)
+            try:
+                adv = int(round(font.getlength(ch))) or w
+            except AttributeError:  # PIL built-in bitmap fallback font
+                adv = w
+            entry = _GLYPH_CACHE[key] = (glyph, adv)
+        glyph, adv = entry
+        img.paste(glyph, (x, y), glyph)
+        x += adv
+
+
+# Shared framebuffer reused across frames.  Allocating a fresh 128x128 RGB
+# image (~49 KB) per redraw was pure allocator/GC churn; clearing the same
+# buffer in place is safe because show_image() packs the pixels to bytes
+# before the next frame is drawn and no screen keeps a reference to it.
+_FRAME = Image.new("RGB", (DISP_WIDTH, DISP_HEIGHT), CLR_BG)
+_FRAME_DRAW = ImageDraw.Draw(_FRAME)
+
+
 def new_frame() -> (Image.Image, ImageDraw.ImageDraw):
-    """Create a fresh black frame buffer and its drawing context."""
-    img = Image.new("RGB", (DISP_WIDTH, DISP_HEIGHT), CLR_BG)
-    return img, ImageDraw.Draw(img)
+    """Return the shared frame buffer, cleared to black, and its draw context."""
+    _FRAME_DRAW.rectangle([(0, 0), (DISP_WIDTH - 1, DISP_HEIGHT - 1)], fill=CLR_BG)
+    return _FRAME, _FRAME_DRAW
 
 
 # =============================================================================
 # SCREEN: STAT
 # =============================================================================
 
-def _get_cpu_percent() -> str:
-    """Read CPU usage from /proc/stat (single-shot, non-blocking)."""
+def _ttl_cached(seconds):
+    """Memoize a zero-argument metric getter for *seconds*.
+
+    The sampler ticks every second, but several metrics change far more
+    slowly (disk fill, the IP address), so their underlying reads can be
+    skipped on most ticks.
+    """
+    def deco(fn):
+        state = {"t": None, "v": None}
+
+        @functools.wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            if state["t"] is None or now - state["t"] >= seconds:
+                state["v"] = fn()
+                state["t"] = now
+            return state["v"]
+        return wrapper
+    return deco
+
+
+# Cached descriptors for the /proc and sysfs metric files.  These pseudo-
+# files regenerate their contents on every read, so a pread() from offset 0
+# returns a fresh snapshot while skipping the path lookup, permission check
+# and fd allocation of a full open/close per poll.
+
+def _open_ro(path):
     try:
-        with open("/proc/stat") as f:
-            parts = f.readline().split()
-        # idle is field index 4
-        idle = int(parts[4])
-        total = sum(int(x) for x in parts[1:])
-        # We only have an instant snapshot; store for next call
-        if not hasattr(_get_cpu_percent, '_prev'):
-            _get_cpu_percent._prev = (idle, total)
-            return "N/A"
-        prev_idle, prev_total = _get_cpu_percent._prev
-        _get_cpu_percent._prev = (idle, total)
-        d_idle  = idle - prev_idle
-        d_total = total - prev_total
-        if d_total == 0:
-            return "0%"
-        return f"{int((1.0 - d_idle / d_total) * 100)}%"
-    except Exception:
-        return "ERR"
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+_FD_STAT    = _open_ro("/proc/stat")
+_FD_MEMINFO = _open_ro("/proc/meminfo")
+_FD_UPTIME  = _open_ro("/proc/uptime")
+_FD_THERMAL = _open_ro("/sys/class/thermal/thermal_zone0/temp")
+
+
+@atexit.register
+def _close_metric_fds():
+    for fd in (_FD_STAT, _FD_MEMINFO, _FD_UPTIME, _FD_THERMAL):
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
 
+def _read_cpu_times() -> (int, int):
+    """Return (idle, total) jiffies from the aggregate /proc/stat line."""
+    # Only user..softirq (fields 1-7) are needed; a 256-byte pread always
+    # covers them with margin even as the counters grow wide.
+    fields = os.pread(_FD_STAT, 256, 0).split(b"\n", 1)[0].split()
+    vals = list(map(int, fields[1:8]))
+    return vals[3], sum(vals)     # idle is the 4th value
 
+
+# MemTotal / MemFree / MemAvailable are the first three lines of
+# /proc/meminfo on every Linux we care about, so 256 bytes is plenty.
+_MEMINFO_RE = re.compile(rb"MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)", re.S)
+
+
+@_ttl_cached(2.0)
 def _get_ram_info() -> (str, str):
     """Return (used_str, total_str) from /proc/meminfo in MB."""
     try:
-        mem = {}
-        with open("/proc/meminfo") as f:
-            for line in f:
-                parts = line.split()
-                mem[parts[0].rstrip(":")] = int(parts[1])  # kB
-        total_mb = mem["MemTotal"] // 1024
-        avail_mb = mem["MemAvailable"] // 1024
+        m = _MEMINFO_RE.search(os.pread(_FD_MEMINFO, 256, 0))
+        total_mb = int(m.group(1)) >> 10   # kB -> MB
+        avail_mb = int(m.group(2)) >> 10
         used_mb  = total_mb - avail_mb
         return f"{used_mb}MB", f"{total_mb}MB"
     except Exception:
         return "ERR", "ERR"
 
 
+@_ttl_cached(10.0)
 def _get_disk_info() -> (str, str):
     """Return (used_str, total_str) for the root partition in MB."""
     try:
@@ -506,23 +789,28 @@ def _get_disk_info() -> (str, str):
         return "ERR", "ERR"
 
 
+@_ttl_cached(30.0)
 def _get_ip_address() -> str:
-    """Best-effort local IP via hostname -I."""
+    """Best-effort local IP via a connected UDP socket.
+
+    connect() on a datagram socket just picks the outbound interface and
+    source address — no packet is sent — which replaces the old
+    `hostname -I` fork/exec (and its up-to-2 s stall).
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
-        result = subprocess.run(
-            ["hostname", "-I"], capture_output=True, text=True, timeout=2
-        )
-        addrs = result.stdout.strip().split()
-        return addrs[0] if addrs else "No IP"
-    except Exception:
+        s.connect(("10.255.255.255", 1))
+        return s.getsockname()[0]
+    except OSError:
         return "No IP"
+    finally:
+        s.close()
 
 
 def _get_uptime() -> str:
     """Human-readable uptime string."""
     try:
-        with open("/proc/uptime") as f:
-            secs = float(f.readline().split()[0])
+        secs = float(os.pread(_FD_UPTIME, 64, 0).split()[0])
         h = int(secs // 3600)
         m = int((secs % 3600) // 60)
         s = int(secs % 60)
@@ -536,16 +824,95 @@ def _get_uptime() -> str:
         return "ERR"
 
 
+@_ttl_cached(2.0)
 def _get_cpu_temp() -> str:
     """Read CPU temperature (Raspbian thermal zone)."""
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp") as f:
-            millideg = int(f.read().strip())
+        millideg = int(os.pread(_FD_THERMAL, 16, 0))
         return f"{millideg // 1000}C"
     except Exception:
         return "N/A"
 
 
+class _StatSampler(threading.Thread):
+    """Background sampler for the DATA screen's system metrics.
+
+    Refreshes once a second so draw() never touches /proc — or worse, forks
+    `hostname -I` — on the render path.  Each refresh publishes a complete
+    new dict via a single attribute rebind, which is atomic in CPython, so
+    readers need no lock.
+    """
+
+    INTERVAL_SECS = 1.0
+
+    def __init__(self):
+        super().__init__(daemon=True, name="stat-sampler")
+        self.snapshot = {
+            "CPU":  "N/A",
+            "RAM":  "...",
+            "DISK": "...",
+            "IP":   "...",
+            "UP":   "...",
+            "TEMP": "...",
+        }
+        # Bumped only when a displayed value actually changes, so consumers
+        # can cache whatever they derived from the snapshot.
+        self.version = 0
+        self._prev_cpu = None   # (idle, total) from the previous sample
+        self._stop = threading.Event()
+
+    def run(self):
+        while True:
+            self._sample()
+            if self._stop.wait(self.INTERVAL_SECS):
+                return
+
+    def stop(self):
+        """Ask the sampler to exit (it also dies with the process — daemon)."""
+        self._stop.set()
+
+    def _sample(self):
+        try:
+            idle, total = _read_cpu_times()
+            if self._prev_cpu is None:
+                cpu = "N/A"
+            else:
+                d_idle  = idle - self._prev_cpu[0]
+                d_total = total - self._prev_cpu[1]
+                cpu = "0%" if d_total == 0 else f"{int((1.0 - d_idle / d_total) * 100)}%"
+            self._prev_cpu = (idle, total)
+        except Exception:
+            cpu = "ERR"
+
+        ram_used, ram_total = _get_ram_info()
+        disk_used, disk_total = _get_disk_info()
+
+        snap = {
+            "CPU":  cpu,
+            "RAM":  f"{ram_used}/{ram_total}",
+            "DISK": f"{disk_used}/{disk_total}",
+            "IP":   _get_ip_address(),
+            "UP":   _get_uptime(),
+            "TEMP": _get_cpu_temp(),
+        }
+        if snap != self.snapshot:
+            self.snapshot = snap
+            self.version += 1
+            WAKE_EVENT.set()    # give the main loop a chance to show new values
+
+
+_SAMPLER = None
+
+
+def _get_sampler() -> _StatSampler:
+    """Start the shared stat sampler on first use."""
+    global _SAMPLER
+    if _SAMPLER is None:
+        _SAMPLER = _StatSampler()
+        _SAMPLER.start()
+    return _SAMPLER
+
+
 class StatScreen:
     """STAT screen — Vault Boy splash / welcome screen."""
 
@@ -563,14 +930,21 @@ class StatScreen:
         except Exception as e:
             print(f"WARNING: Could not load VaultBoy.png ({e}). STAT screen will show text only.")
 
+        # The STAT screen is entirely static, so the full frame is rendered
+        # exactly once here and draw() just hands it back.  It gets its own
+        # Image rather than the shared new_frame() buffer precisely because
+        # it outlives a single frame.
+        self._frame = self._render()
+
     def handle_event(self, evt):
         pass
 
-    def draw(self) -> Image.Image:
-        img, draw = new_frame()
+    def _render(self) -> Image.Image:
+        img = Image.new("RGB", (DISP_WIDTH, DISP_HEIGHT), CLR_BG)
+        draw = ImageDraw.Draw(img)
 
         # --- Header ---
-        draw_header(draw, "STAT", 0, 4)
+        draw_header(img, "STAT", 0, 4)
 
         # --- Vault Boy sprite, centred horizontally, sitting in the upper
         #     portion of the screen ---
@@ -601,10 +975,14 @@ class StatScreen:
             text_y += 11
 
         # --- Footer ---
-        draw_footer(draw, "<> switch  K1+K2 off")
+        draw_footer(img, "<> switch  K1+K2 off")
 
         return img
 
+    def draw(self) -> Image.Image:
+        # show_image only reads pixels, so sharing the cached instance is fine
+        return self._frame
+
 
 # =============================================================================
 # SCREEN: DATA (System Information)
@@ -613,51 +991,60 @@ class StatScreen:
 class DataScreen:
     """DATA screen — system information dashboard."""
 
+    _LABELS   = ("CPU", "RAM", "DISK", "IP", "UP", "TEMP")
+    _BODY_TOP = 19   # first line below the header
+    _LINE_H   = 12
+
     def __init__(self):
-        # Kick off the first CPU read so we have a baseline on the next frame
-        _get_cpu_percent()
+        # The sampler refreshes metrics off-thread; its first tick also seeds
+        # the CPU-usage baseline.
+        self._sampler = _get_sampler()
+        # Header, footer and the label column never change — render them once
+        # into a template and measure where each value column starts, so
+        # draw() only has to rasterize the six value strings.
+        self._value_x = {}
+        self._template = self._build_template()
+        # Rendered frame, reused until the sampler publishes new values
+        self._frame = None
+        self._version = -1
+
+    def _build_template(self) -> Image.Image:
+        img = Image.new("RGB", (DISP_WIDTH, DISP_HEIGHT), CLR_BG)
+        draw = ImageDraw.Draw(img)
+        draw_header(img, "DATA", 2, 4)
+        y = self._BODY_TOP
+        for label in self._LABELS:
+            text = f"{label}:"
+            draw.text((4, y), text, fill=CLR_GREEN_DIM, font=FONT_BODY)
+            self._value_x[label] = 6 + draw.textbbox((0, 0), text, font=FONT_BODY)[2]
+            y += self._LINE_H
+        draw_footer(img, "<> switch screen")
+        return img
 
     def handle_event(self, evt):
         # DATA screen has no interactive elements; all nav is handled by main loop
         pass
 
     def draw(self) -> Image.Image:
-        img, draw = new_frame()
-
-        # --- Header ---
-        draw_header(draw, "DATA", 2, 4)
-
-        # --- Body content ---
-        y = 19  # start below header
-        line_h = 12
-
-        cpu   = _get_cpu_percent()
-        ram_used, ram_total = _get_ram_info()
-        disk_used, disk_total = _get_disk_info()
-        ip    = _get_ip_address()
-        up    = _get_uptime()
-        temp  = _get_cpu_temp()
+        # The sampler bumps .version only when a displayed value changed, so
+        # an idle DATA screen is an int compare plus a reference return.
+        version = self._sampler.version
+        if version == self._version and self._frame is not None:
+            return self._frame
 
-        lines = [
-            ("CPU",   cpu),
-            ("RAM",   f"{ram_used}/{ram_total}"),
-            ("DISK",  f"{disk_used}/{disk_total}"),
-            ("IP",    ip),
-            ("UP",    up),
-            ("TEMP",  temp),
-        ]
+        img = self._template.copy()
+        draw = ImageDraw.Draw(img)
 
-        for label, value in lines:
-            # Label (dim green, left-aligned)
-            draw.text((4, y), f"{label}:", fill=CLR_GREEN_DIM, font=FONT_BODY)
-            # Value (bright green, indented)
-            label_w = draw.textbbox((0, 0), f"{label}:", font=FONT_BODY)[2]
-            draw.text((6 + label_w, y), value, fill=CLR_GREEN, font=FONT_BODY)
-            y += line_h
+        values = self._sampler.snapshot
 
-        # --- Footer ---
-        draw_footer(draw, "<> switch screen")
+        y = self._BODY_TOP
+        for label in self._LABELS:
+            draw.text((self._value_x[label], y), values[label],
+                      fill=CLR_GREEN, font=FONT_BODY)
+            y += self._LINE_H
 
+        self._frame = img
+        self._version = version
         return img
 
 
@@ -668,18 +1055,39 @@ class DataScreen:
 class InvScreen:
     """INV screen — scrollable text viewer for inv.txt."""
 
+    # Body/scrollbar geometry depends only on display constants, so fold it
+    # once here instead of recomputing it every frame and key press.
+    _BODY_TOP     = 18
+    _LINE_H       = 10
+    _TRACK_TOP    = 18
+    _TRACK_BOTTOM = DISP_HEIGHT - 15
+    _TRACK_H      = _TRACK_BOTTOM - _TRACK_TOP
+    _VISIBLE      = (_TRACK_BOTTOM - 17) // _LINE_H  # ~10 px per line
+
     def __init__(self):
         self._lines = []
         self._scroll_offset = 0
         self._load_file()
+        # The alternating-row shading is pixel-identical every frame, so it
+        # is baked once here; draw() pastes the slice covering however many
+        # lines are on screen instead of filling rectangles row by row.
+        stripes = Image.new("RGB", (DISP_WIDTH, self._VISIBLE * self._LINE_H),
+                            CLR_BG)
+        sd = ImageDraw.Draw(stripes)
+        for i in range(0, self._VISIBLE, 2):
+            sd.rectangle([(1, i * self._LINE_H),
+                          (DISP_WIDTH - 2, (i + 1) * self._LINE_H - 1)],
+                         fill=CLR_ROW_SHADE)
+        self._stripe_rows = [stripes.crop((0, 0, DISP_WIDTH, n * self._LINE_H))
+                             for n in range(self._VISIBLE + 1)]
 
     def _load_file(self):
         """(Re)load inv.txt into memory."""
         try:
             with open(INV_FILE, "r") as f:
-                self._lines = f.read().splitlines()
+                raw = f.read().splitlines()
         except FileNotFoundError:
-            self._lines = [
+            raw = [
                 "[ inv.txt not found ]",
                 "",
                 "Create inv.txt in the",
@@ -688,63 +1096,55 @@ class InvScreen:
                 "your inventory.",
             ]
         except Exception as e:
-            self._lines = [f"ERROR: {e}"]
+            raw = [f"ERROR: {e}"]
+        # Clip to the display width once at load time so draw() never slices,
+        # and cache the scroll bound used on every UP/DOWN press.
+        self._lines = [ln[:20] for ln in raw]
+        self._n_lines = len(self._lines)
+        self._max_scroll = max(0, self._n_lines - self._VISIBLE)
 
     def handle_event(self, evt):
-        max_scroll = max(0, len(self._lines) - self._visible_lines())
         if evt == EVT_UP:
             self._scroll_offset = max(0, self._scroll_offset - 1)
         elif evt == EVT_DOWN:
-            self._scroll_offset = min(max_scroll, self._scroll_offset + 1)
+            self._scroll_offset = min(self._max_scroll, self._scroll_offset + 1)
         elif evt == EVT_SEL:
             # Re-read the file on SELECT (handy for hot-editing)
             self._load_file()
             self._scroll_offset = 0
 
-    def _visible_lines(self) -> int:
-        """How many text lines fit in the body area."""
-        body_top    = 17
-        body_bottom = DISP_HEIGHT - 15
-        return (body_bottom - body_top) // 10  # ~10 px per line
-
     def draw(self) -> Image.Image:
         img, draw = new_frame()
 
-        draw_header(draw, "INV", 1, 4)
+        draw_header(img, "INV", 1, 4)
 
-        y = 18
-        line_h = 10
-        visible = self._visible_lines()
+        y = self._BODY_TOP
+        line_h = self._LINE_H
+        visible = self._VISIBLE
 
-        for i in range(visible):
-            idx = self._scroll_offset + i
-            if idx >= len(self._lines):
-                break
-            line = self._lines[idx]
-            # Highlight alternating rows subtly
-            if i % 2 == 0:
-                draw.rectangle([(1, y - 1), (DISP_WIDTH - 2, y + line_h - 2)],
-                               fill=(0, 12, 0))
-            # Clip long lines to screen width
-            draw.text((3, y), line[:20], fill=CLR_GREEN, font=FONT_BODY)
+        # Pre-baked alternating-row shading, then just the text on top
+        rows = max(0, min(visible, self._n_lines - self._scroll_offset))
+        if rows:
+            img.paste(self._stripe_rows[rows], (0, y - 1))
+        for i in range(rows):
+            blit_text(img, (3, y), self._lines[self._scroll_offset + i],
+                      FONT_BODY, CLR_GREEN)
             y += line_h
 
         # Scroll indicator on right edge
-        if len(self._lines) > visible:
-            track_top    = 18
-            track_bottom = DISP_HEIGHT - 15
-            track_h      = track_bottom - track_top
-            thumb_h      = max(8, int(track_h * visible / len(self._lines)))
-            thumb_pos    = track_top + int(
+        if self._n_lines > visible:
+            track_h   = self._TRACK_H
+            thumb_h   = max(8, int(track_h * visible / self._n_lines))
+            thumb_pos = self._TRACK_TOP + int(
                 (track_h - thumb_h) * self._scroll_offset /
-                max(1, len(self._lines) - visible)
+                max(1, self._n_lines - visible)
             )
-            draw.rectangle([(DISP_WIDTH - 4, track_top),
-                            (DISP_WIDTH - 2, track_bottom)], fill=CLR_GREEN_DIM)
+            draw.rectangle([(DISP_WIDTH - 4, self._TRACK_TOP),
+                            (DISP_WIDTH - 2, self._TRACK_BOTTOM)], fill=CLR_GREEN_DIM)
             draw.rectangle([(DISP_WIDTH - 4, thumb_pos),
                             (DISP_WIDTH - 2, thumb_pos + thumb_h)], fill=CLR_GREEN)
 
-        draw_footer(draw, "^v scroll  SEL reload")
+        draw_footer(img, "^v scroll  SEL reload")
 
         return img
 
@@ -753,24 +1153,96 @@ class InvScreen:
 # SCREEN: RADIO (MP3 Player)
 # =============================================================================
 
+# Music directory listing, cached on the directory's mtime: a rescan that
+# finds nothing changed costs one stat() instead of a full directory walk.
+_MUSIC_EXTS = (".mp3", ".ogg", ".wav")
+_music_cache = (None, [])   # (st_mtime_ns, track names)
+
+
+def get_music_files() -> list:
+    """Return the sorted audio filenames in MUSIC_DIR (cached by mtime)."""
+    global _music_cache
+    if not os.path.isdir(MUSIC_DIR):
+        os.makedirs(MUSIC_DIR, exist_ok=True)
+    mtime = os.stat(MUSIC_DIR).st_mtime_ns
+    if mtime != _music_cache[0]:
+        with os.scandir(MUSIC_DIR) as it:
+            tracks = sorted(e.name for e in it
+                            if e.is_file() and e.name.lower().endswith(_MUSIC_EXTS))
+        _music_cache = (mtime, tracks)
+    return _music_cache[1]
+
+
+# SDL event id posted by the mixer when a track finishes.
+TRACK_END_EVENT = pygame.USEREVENT + 1 if AUDIO_AVAILABLE else None
+
+
 class RadioScreen:
     """RADIO screen — simple MP3 player for files in ./music/."""
 
+    # Track-list geometry — constant, folded once like InvScreen's
+    _LIST_TOP     = 18 + 25  # body top + now-playing block
+    _LINE_H       = 10
+    _TRACK_BOTTOM = DISP_HEIGHT - 15
+    _TRACK_H      = _TRACK_BOTTOM - _LIST_TOP
+    _VISIBLE      = max(1, (_TRACK_BOTTOM - _LIST_TOP) // _LINE_H)
+
     def __init__(self):
         self._tracks = []
         self._current = 0       # index into _tracks
         self._playing = False
         self._selected = 0      # cursor position in the track list
+        self._row_cache = {}    # (name, prefix, col, selected) -> row strip
+        # Private frame, redrawn only when state changes (_dirty).  Like the
+        # STAT screen's cached frame, it can't live in the shared new_frame()
+        # buffer because it is returned across frames.
+        self._frame = Image.new("RGB", (DISP_WIDTH, DISP_HEIGHT), CLR_BG)
+        self._dirty = True
         self._load_tracks()
+        if AUDIO_AVAILABLE:
+            pygame.mixer.music.set_endevent(TRACK_END_EVENT)
 
     # --- Track discovery ---------------------------------------------------
     def _load_tracks(self):
-        self._tracks = []
-        if not os.path.isdir(MUSIC_DIR):
-            os.makedirs(MUSIC_DIR, exist_ok=True)
-        for fname in sorted(os.listdir(MUSIC_DIR)):
-            if fname.lower().endswith((".mp3", ".ogg", ".wav")):
-                self._tracks.append(fname)
+        self._tracks = get_music_files()
+        # Truncate names to the display width once here, not per frame
+        self._display_names = [n[:15] + "..." if len(n) > 18 else n
+                               for n in self._tracks]
+        self._row_cache.clear()
+
+    def _maybe_reload(self):
+        """Pick up music/ changes between frames.
+
+        get_music_files() returns the same list object until the directory
+        mtime changes, so the steady-state cost is one stat() and an identity
+        check — no rescans, no reallocation.
+        """
+        if get_music_files() is not self._tracks:
+            self._load_tracks()
+            # The list may have shrunk; keep cursor and track index valid
+            last = max(0, len(self._tracks) - 1)
+            self._selected = min(self._selected, last)
+            self._current = min(self._current, last)
+            self._dirty = True
+
+    def _row_strip(self, name: str, prefix: str, col, selected: bool) -> Image.Image:
+        """Return a pre-rendered track-list row (cached).
+
+        FreeType rasterization is the most expensive per-frame PIL call this
+        screen makes, and the set of distinct rows is tiny, so each rendered
+        row is kept and re-pasted.  Strips include the selection bar and
+        overlap by one row — the same layering the old rect + text draws had.
+        """
+        key = (name, prefix, col, selected)
+        strip = self._row_cache.get(key)
+        if strip is None:
+            strip = Image.new("RGB", (DISP_WIDTH, 11), CLR_BG)
+            d = ImageDraw.Draw(strip)
+            if selected:
+                d.rectangle([(1, 0), (DISP_WIDTH - 2, 9)], fill=CLR_SEL_SHADE)
+            blit_text(strip, (3, 1), prefix + name, FONT_SMALL, col)
+            self._row_cache[key] = strip
+        return strip
 
     # --- Playback control --------------------------------------------------
     def _play_track(self, index: int):
@@ -791,6 +1263,9 @@ class RadioScreen:
         if AUDIO_AVAILABLE:
             try:
                 pygame.mixer.music.stop()
+                # stop() also posts the end event — drop it so it isn't
+                # mistaken for a natural end-of-track later.
+                pygame.event.get(TRACK_END_EVENT)
             except Exception:
                 pass
         self._playing = False
@@ -817,18 +1292,23 @@ class RadioScreen:
 
     # --- Check if track ended spontaneously --------------------------------
     def _check_ended(self):
-        if self._playing and AUDIO_AVAILABLE:
-            if not pygame.mixer.music.get_busy():
-                # Track finished naturally — move to next
-                self._current = (self._current + 1) % len(self._tracks) if self._tracks else 0
-                self._play_track(self._current)
-                self._selected = self._current
+        """Advance to the next track when SDL posts an end-of-music event."""
+        if not (self._playing and AUDIO_AVAILABLE and self._tracks):
+            return
+        if pygame.event.get(TRACK_END_EVENT):
+            # Track finished naturally — move to next
+            self._play_track((self._current + 1) % len(self._tracks))
+            self._selected = self._current
+            self._dirty = True
 
     # --- Event handling ----------------------------------------------------
     def handle_event(self, evt):
         if not self._tracks:
             return  # no tracks; nothing to do
 
+        # Every handled event moves the cursor or changes playback state
+        self._dirty = True
+
         if evt == EVT_UP:
             self._selected = (self._selected - 1) % len(self._tracks)
         elif evt == EVT_DOWN:
@@ -849,16 +1329,22 @@ class RadioScreen:
     # --- Rendering ---------------------------------------------------------
     def draw(self) -> Image.Image:
         self._check_ended()
+        self._maybe_reload()
+        if not self._dirty:
+            return self._frame
 
-        img, draw = new_frame()
-        draw_header(draw, "RADIO", 3, 4)
+        img = self._frame
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([(0, 0), (DISP_WIDTH - 1, DISP_HEIGHT - 1)], fill=CLR_BG)
+        draw_header(img, "RADIO", 3, 4)
 
         if not self._tracks:
             # Empty state
             draw.text((8, 40), "No audio files found", fill=CLR_GREEN_DIM, font=FONT_BODY)
             draw.text((8, 52), "Put .mp3/.ogg/.wav", fill=CLR_GREEN_DIM, font=FONT_BODY)
             draw.text((8, 64), "into ./music/", fill=CLR_GREEN_DIM, font=FONT_BODY)
-            draw_footer(draw, "")
+            draw_footer(img, "")
+            self._dirty = False
             return img
 
         # --- Now-playing indicator ---
@@ -868,18 +1354,15 @@ class RadioScreen:
         draw.text((4, y), f"[{status_str}]", fill=status_col, font=FONT_BODY)
 
         if self._tracks:
-            # Truncate current track name
-            cur_name = self._tracks[self._current]
-            if len(cur_name) > 18:
-                cur_name = cur_name[:15] + "..."
-            draw.text((4, y + 10), cur_name, fill=CLR_CYAN, font=FONT_BODY)
+            draw.text((4, y + 10), self._display_names[self._current],
+                      fill=CLR_CYAN, font=FONT_BODY)
 
         draw_divider(draw, y + 22)
 
         # --- Track list ---
-        list_top    = y + 25
-        line_h      = 10
-        visible     = max(1, (DISP_HEIGHT - 15 - list_top) // line_h)
+        list_top    = self._LIST_TOP
+        line_h      = self._LINE_H
+        visible     = self._VISIBLE
         # Ensure selected track is visible (auto-scroll)
         scroll = 0
         if self._selected >= visible:
@@ -890,18 +1373,11 @@ class RadioScreen:
             if idx >= len(self._tracks):
                 break
             track_y = list_top + i * line_h
-            name = self._tracks[idx]
-            if len(name) > 18:
-                name = name[:15] + "..."
+            name = self._display_names[idx]
 
             is_selected = (idx == self._selected)
             is_playing  = (idx == self._current and self._playing)
 
-            # Selection highlight
-            if is_selected:
-                draw.rectangle([(1, track_y - 1), (DISP_WIDTH - 2, track_y + line_h - 2)],
-                               fill=(0, 30, 10))
-
             # Prefix markers
             prefix = "  "
             if is_playing:
@@ -912,24 +1388,24 @@ class RadioScreen:
             col = CLR_GREEN if is_selected else CLR_GREEN_DIM
             if is_playing:
                 col = CLR_CYAN
-            draw.text((3, track_y), prefix + name, fill=col, font=FONT_SMALL)
+            img.paste(self._row_strip(name, prefix, col, is_selected),
+                      (0, track_y - 1))
 
         # Scroll indicator
         if len(self._tracks) > visible:
-            track_top_px    = list_top
-            track_bottom_px = DISP_HEIGHT - 15
-            track_h         = track_bottom_px - track_top_px
-            thumb_h         = max(6, int(track_h * visible / len(self._tracks)))
-            thumb_pos       = track_top_px + int(
+            track_h   = self._TRACK_H
+            thumb_h   = max(6, int(track_h * visible / len(self._tracks)))
+            thumb_pos = list_top + int(
                 (track_h - thumb_h) * scroll / max(1, len(self._tracks) - visible)
             )
-            draw.rectangle([(DISP_WIDTH - 4, track_top_px),
-                            (DISP_WIDTH - 2, track_bottom_px)], fill=CLR_GREEN_DIM)
+            draw.rectangle([(DISP_WIDTH - 4, list_top),
+                            (DISP_WIDTH - 2, self._TRACK_BOTTOM)], fill=CLR_GREEN_DIM)
             draw.rectangle([(DISP_WIDTH - 4, thumb_pos),
                             (DISP_WIDTH - 2, thumb_pos + thumb_h)], fill=CLR_GREEN)
 
-        draw_footer(draw, "K1:play K2:next K3:stop")
+        draw_footer(img, "K1:play K2:next K3:stop")
 
+        self._dirty = False
         return img
 
     def cleanup(self):
@@ -971,6 +1447,13 @@ class PipBoyMini:
         self._shutdown_state    = "idle"
         self._shutdown_deadline = 0     # monotonic timestamp when countdown expires
 
+        # --- Idle backlight dimming ---
+        self._last_event_time = time.monotonic()
+        self._dimmed = False
+
+        # Countdown digit widths, measured lazily by _draw_shutdown_confirm
+        self._digit_widths = {}
+
     # --- Shutdown confirmation screen --------------------------------------
     def _draw_shutdown_confirm(self) -> Image.Image:
         """Render the 'SHUTDOWN' countdown overlay.  Returns a full frame."""
@@ -978,12 +1461,14 @@ class PipBoyMini:
         img, draw = new_frame()
 
         # Header
-        draw_header(draw, "SHUTDOWN", 0, 1)
+        draw_header(img, "SHUTDOWN", 0, 1)
 
-        # Big countdown number, centred
+        # Big countdown number, centred (digit widths measured once)
         secs_str = str(int(remaining) + 1)   # show 3, 2, 1 (not 2, 1, 0)
-        bbox     = draw.textbbox((0, 0), secs_str, font=FONT_BIG)
-        tw, th   = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        tw = self._digit_widths.get(secs_str)
+        if tw is None:
+            bbox = draw.textbbox((0, 0), secs_str, font=FONT_BIG)
+            tw = self._digit_widths[secs_str] = bbox[2] - bbox[0]
         draw.text(((DISP_WIDTH - tw) // 2, 38), secs_str,
                   fill=CLR_GREEN, font=FONT_BIG)
 
@@ -1002,40 +1487,66 @@ class PipBoyMini:
             draw.rectangle([(bar_left, bar_y), (bar_left + fill_w, bar_y + 4)],
                            fill=CLR_GREEN)
 
-        draw_footer(draw, "any button: cancel")
+        draw_footer(img, "any button: cancel")
         return img
 
     # --- Main loop ---------------------------------------------------------
     def run(self):
         print("[PipBoy Mini] Running.  Press Ctrl+C to exit.")
         interval = 1.0 / REFRESH_RATE_HZ
+        # Absolute render deadline (monotonic).  Pacing against a carried
+        # deadline instead of "last render + interval" keeps the countdown
+        # animation fixed-phase: sleep overshoot doesn't accumulate.
+        next_render = time.monotonic()
 
         while self._running:
-            t0 = time.time()
-
-            # 1. Poll input
-            self.input.poll()
+            # 1. Sleep until something needs the screen — a button edge or a
+            #    sampler tick sets WAKE_EVENT; the timeout is a fallback
+            #    heartbeat, kept at frame rate while the shutdown countdown
+            #    needs animating.
+            timeout = interval if self._shutdown_state == "confirming" else 1.0
+            WAKE_EVENT.wait(timeout)
+            WAKE_EVENT.clear()
+
+            # Cap the redraw rate at REFRESH_RATE_HZ under event bursts.
+            remaining = next_render - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+
+            # Fetch queued input (edge callbacks fill the queue)
             evt = self.input.get_event()
 
-            # 2. Shutdown combo detection (before normal event dispatch)
-            combo_held = self.input.pins_held(SHUTDOWN_COMBO_PINS)
-
+            # Idle backlight dimming: any press restores full brightness
+            # (the press still performs its normal action).
+            now = time.monotonic()
+            if evt is not None:
+                self._last_event_time = now
+                if self._dimmed:
+                    self.display.set_backlight_dim(False)
+                    self._dimmed = False
+            elif not self._dimmed and now - self._last_event_time >= IDLE_DIM_SECS:
+                self.display.set_backlight_dim(True)
+                self._dimmed = True
+
+            # 2. Shutdown combo detection (before normal event dispatch).
+            # The edge callbacks maintain combo_event, so this is a flag
+            # check — no GPIO reads on the frame path.
             if self._shutdown_state == "idle":
-                if combo_held:
+                if self.input.combo_event.is_set():
                     # Combo just detected — enter confirming state
                     self._shutdown_state    = "confirming"
                     self._shutdown_deadline = time.monotonic() + SHUTDOWN_CONFIRM_SECS
                     print("[PipBoy Mini] Shutdown combo detected — confirmation countdown started.")
-                    # Drain any KEY1/KEY2 edge events the poller just queued
-                    # so they don't also fire on the current screen.
+                    # Drain any KEY1/KEY2 edge events the callbacks just
+                    # queued so they don't also fire on the current screen.
                     evt = None
-                    while self.input.get_event() is not None:
-                        pass
+                    self.input.drain_events()
 
             elif self._shutdown_state == "confirming":
                 if evt is not None:
                     # Any button press during countdown → cancel
                     self._shutdown_state = "idle"
+                    self.input.combo_event.clear()   # re-arm: needs a fresh press
                     print("[PipBoy Mini] Shutdown cancelled.")
                     evt = None   # don't let the cancel-press also do something else
                 elif time.monotonic() >= self._shutdown_deadline:
@@ -1044,30 +1555,35 @@ class PipBoyMini:
                     self._do_poweroff()
                     break       # exits the main loop; finally block runs cleanup
 
-            # 3. Dispatch normal events (skipped while confirming)
+            # 3. Screen switching (skipped while confirming)
             if self._shutdown_state == "idle" and evt:
                 if evt == EVT_LEFT:
                     self.current_screen = (self.current_screen - 1) % len(self.screens)
+                    evt = None
                 elif evt == EVT_RIGHT:
                     self.current_screen = (self.current_screen + 1) % len(self.screens)
-                else:
-                    # Pass event down to current screen
-                    self.screens[self.current_screen].handle_event(evt)
+                    evt = None
 
-            # 4. Render
+            # 4. Dispatch and render — one screen lookup serves both
             if self._shutdown_state == "confirming":
                 frame = self._draw_shutdown_confirm()
             else:
-                frame = self.screens[self.current_screen].draw()
+                screen = self.screens[self.current_screen]
+                if evt:
+                    # Pass event down to current screen
+                    screen.handle_event(evt)
+                frame = screen.draw()
 
             # 5. Push frame to display
             self.display.show_image(frame)
+            next_render += interval
+            now = time.monotonic()
+            if next_render < now:
+                next_render = now   # overran a whole frame — don't try to catch up
 
-            # 6. Sleep remainder of frame budget
-            elapsed = time.time() - t0
-            sleep_time = interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # 6. Don't block on the next wait if more input is already queued.
+            if self.input.pending():
+                WAKE_EVENT.set()
 
     # --- Poweroff ----------------------------------------------------------
     def _do_poweroff(self):
@@ -1082,6 +1598,9 @@ class PipBoyMini:
     def cleanup(self):
         print("[PipBoy Mini] Shutting down...")
         self._running = False
+        # Stop the metric sampler so it doesn't fire mid-teardown
+        if _SAMPLER is not None:
+            _SAMPLER.stop()
         # Stop audio (RadioScreen is the last screen in the list)
         if hasattr(self.screens[-1], 'cleanup'):
             self.screens[-1].cleanup()